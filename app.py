@@ -4,11 +4,24 @@ Complete analytics with officer performance, statute violations, and secondary c
 """
 
 import dash
-from dash import dcc, html, Input, Output, dash_table
-import plotly.express as px
+from dash import dcc, html, Input, Output, State, dash_table, Patch
+from dash.exceptions import PreventUpdate
 import plotly.graph_objects as go
+import plotly.io as pio
 import pandas as pd
+import numpy as np
+import functools
+import hashlib
+import copy
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
 
 # Initialize the Dash app
 app = dash.Dash(__name__, 
@@ -20,11 +33,200 @@ server = app.server
 # App title for browser tab
 app.title = "Enhanced Criminal Cases Dashboard"
 
+# Dash encodes callback responses through Plotly's JSON layer; use orjson's C encoder,
+# which also serializes NumPy values and datetimes without converting them first
+try:
+    pio.json.config.default_engine = 'orjson'
+except Exception as e:
+    print(f"Warning: orjson not available, using the standard JSON encoder: {e}")
+
+# Columnar copy of cases.csv, rewritten whenever the CSV is newer
+PARQUET_FILE = 'cases.parquet'
+
+# Columns referenced by the layout and callbacks; everything else in cases.csv is skipped
+USED_COLS = ['CaseNumber', 'FileDate', 'Lead_Agency', 'Lead_Officer', 'Age_At_Offense',
+             'Gender', 'Race_Tier_1', 'City_Clean', 'Statute', 'Statute_CaseType', 'ChargeOffenseDescription',
+             'Statute_Description', 'Arrest_vs_NonArrest', 'YearMonth']
+
+# Date columns parsed by read_csv, and their format in cases.csv
+DATE_COLUMNS = ['FileDate']
+DATE_FORMAT = '%m/%d/%Y'
+
+# Repetitive text columns stored as pandas categoricals
+CATEGORY_COLUMNS = ['Gender', 'Race_Tier_1', 'Statute_CaseType', 'Arrest_vs_NonArrest',
+                    'Lead_Agency', 'City_Clean', 'ChargeOffenseDescription',
+                    'Lead_Officer', 'Statute_Description', 'Statute', 'YearMonth']
+
+# Bytes per block when streaming cases.csv through pyarrow; lower it to cap peak memory on small hosts
+CSV_BLOCK_SIZE = int(os.environ.get('CSV_BLOCK_SIZE', 8 << 20))
+
+# Numeric columns stored at a fixed width; nullable so missing ages do not force float64
+NUMERIC_DTYPES = {'Age_At_Offense': 'Int16'}
+
+def parse_numeric(series, dtype):
+    """
+    Parse a numeric column leniently into a nullable integer dtype: cells that are
+    not numbers or do not fit the dtype become NA, and fractions are rounded
+    """
+    values = pd.to_numeric(series, errors='coerce').round()
+    bounds = np.iinfo(pd.api.types.pandas_dtype(dtype).numpy_dtype)
+    return values.where(values.between(bounds.min, bounds.max)).astype(dtype)
+
+def convert_categories(df):
+    """
+    Convert low-cardinality text columns to categorical dtype so comparisons,
+    value_counts and groupby operate on integer codes instead of Python strings
+    """
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            try:
+                df[col] = df[col].astype('category')
+            except:
+                print(f"Warning: Could not convert column to category: {col}")
+    return df
+
+def add_derived_columns(df):
+    """
+    Add the analysis columns shared by the real and the sample data
+    """
+    # Create officer case counts for analysis: tally the officer codes once and index
+    # the tallies back by code instead of a groupby split-apply-combine
+    if 'Lead_Officer' in df.columns:
+        if isinstance(df['Lead_Officer'].dtype, pd.CategoricalDtype):
+            codes = df['Lead_Officer'].cat.codes.to_numpy()
+            counts = np.bincount(codes[codes >= 0], minlength=len(df['Lead_Officer'].cat.categories))
+            df['Officer_Case_Count'] = np.where(codes >= 0, counts[codes], 0).astype(np.int32)
+        else:
+            officer_counts = df['Lead_Officer'].value_counts()
+            df['Officer_Case_Count'] = df['Lead_Officer'].map(officer_counts).fillna(0).astype(np.int32)
+    
+    # Flag 790.07 cases; for a categorical only the distinct statutes are searched
+    if 'Statute' in df.columns:
+        if isinstance(df['Statute'].dtype, pd.CategoricalDtype):
+            categories = df['Statute'].cat.categories
+            codes_790 = np.flatnonzero(categories.astype(str).str.contains('790.07', regex=False))
+            df['Is_790_07'] = np.isin(df['Statute'].cat.codes.to_numpy(), codes_790)
+        else:
+            df['Is_790_07'] = df['Statute'].str.contains('790.07', na=False, regex=False)
+    return df
+
+def strip_categories(series):
+    """
+    Strip whitespace from the categories of a categorical column, merging any
+    categories that become identical, without touching the per-row codes
+    """
+    codes = series.cat.codes.values
+    new_codes, categories = pd.factorize(series.cat.categories.astype(str).str.strip())
+    codes = np.where(codes >= 0, new_codes[codes], -1)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=categories), index=series.index)
+
+def order_by_appearance(series):
+    """
+    Reorder the categories of a categorical column by first appearance in the
+    rows (unused categories last), so the order does not depend on the reader
+    """
+    codes = series.cat.codes.to_numpy()
+    seen = pd.unique(codes[codes >= 0])
+    unused = np.setdiff1d(np.arange(len(series.cat.categories)), seen)
+    return series.cat.reorder_categories(series.cat.categories[np.concatenate([seen, unused])])
+
+def fill_missing(series, value):
+    """Fill missing values, adding the fill value as a category when needed"""
+    if isinstance(series.dtype, pd.CategoricalDtype) and value not in series.cat.categories:
+        if not series.isna().any():
+            return series
+        series = series.cat.add_categories([value])
+    return series.fillna(value)
+
+def save_parquet(df):
+    """
+    Save the cleaned data as Parquet so later starts can skip the CSV parse.
+    Written to a per-process temp file and renamed into place, so concurrent
+    workers never read or leave behind a half-written cache.
+    """
+    tmp_file = f"{PARQUET_FILE}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(tmp_file, engine='pyarrow', compression='zstd', index=False)
+        os.replace(tmp_file, PARQUET_FILE)
+        print(f"Saved cleaned data to {PARQUET_FILE}")
+    except Exception as e:
+        print(f"Warning: Could not save {PARQUET_FILE}: {e}")
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+def read_cases_csv(usecols):
+    """
+    Parse the given columns of cases.csv with typed dates and categories. Streams
+    the file through pyarrow in CSV_BLOCK_SIZE blocks when available, else uses
+    pandas' C reader. Numeric columns are read as text and parsed leniently, so
+    one malformed cell becomes NA instead of failing the whole read.
+    """
+    dtypes = {col: 'category' for col in CATEGORY_COLUMNS if col in usecols}
+    numeric_columns = [col for col in NUMERIC_DTYPES if col in usecols]
+    parse_dates = [col for col in DATE_COLUMNS if col in usecols]
+    
+    df = None
+    if pa is not None:
+        try:
+            # Dates and dictionary-encoded strings are converted inside Arrow's C++ parser
+            column_types = {col: pa.timestamp('ns') for col in parse_dates}
+            column_types.update({col: pa.dictionary(pa.int32(), pa.string()) for col in dtypes})
+            column_types.update({col: pa.string() for col in numeric_columns})
+            reader = pacsv.open_csv(
+                'cases.csv',
+                read_options=pacsv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE),
+                convert_options=pacsv.ConvertOptions(include_columns=usecols,
+                                                     column_types=column_types,
+                                                     timestamp_parsers=[DATE_FORMAT],
+                                                     strings_can_be_null=True)
+            )
+            # Only one block of raw text is held at a time; each arrives already typed and projected
+            batches = [batch for batch in reader]
+            table = pa.Table.from_batches(batches, schema=reader.schema)
+            print(f"Parsed cases.csv with pyarrow in {len(batches)} blocks")
+            df = table.to_pandas()
+        except Exception as e:
+            print(f"Warning: pyarrow could not parse cases.csv, using pandas: {e}")
+    
+    if df is None:
+        df = pd.read_csv('cases.csv', usecols=usecols, encoding='utf-8-sig',
+                         dtype={**dtypes, **{col: str for col in numeric_columns}},
+                         parse_dates=parse_dates, date_format=DATE_FORMAT)
+    
+    # Arrow's dictionaries follow first appearance while pandas sorts; settle on appearance
+    for col in dtypes:
+        df[col] = order_by_appearance(df[col])
+    for col in numeric_columns:
+        df[col] = parse_numeric(df[col], NUMERIC_DTYPES[col])
+    return df
+
+def is_parquet_fresh():
+    """Check whether the Parquet copy exists and is at least as new as cases.csv"""
+    if not os.path.exists(PARQUET_FILE):
+        return False
+    if not os.path.exists('cases.csv'):
+        return True
+    return os.path.getmtime(PARQUET_FILE) >= os.path.getmtime('cases.csv')
+
 def load_data():
     """
     Load criminal cases data with maximum error handling
     """
     try:
+        # Prefer the columnar copy, which keeps the cleaned dtypes, unless cases.csv changed since
+        if is_parquet_fresh():
+            try:
+                # Re-applying the categorical dtypes is a no-op unless the column list grew, and
+                # the derived columns are recomputed so a cache from an older version cannot
+                # serve stale flags or counts (both are single passes over category codes)
+                df = add_derived_columns(convert_categories(pd.read_parquet(PARQUET_FILE)))
+                print(f"Loaded {PARQUET_FILE} with shape: {df.shape}")
+                return df
+            except Exception as e:
+                print(f"Warning: Could not read {PARQUET_FILE}, falling back to CSV: {e}")
+        
         # Check if file exists
         if not os.path.exists('cases.csv'):
             print("ERROR: cases.csv file not found!")
@@ -32,8 +234,11 @@ def load_data():
         
         print("Found cases.csv file, attempting to load...")
         
-        # Try to load the CSV file
-        df = pd.read_csv('cases.csv')
+        # Only parse the columns the dashboard uses, reading low-cardinality text as categories.
+        # utf-8-sig drops a leading BOM so the first column name matches as-is.
+        header = pd.read_csv('cases.csv', nrows=0, encoding='utf-8-sig').columns
+        usecols = [col for col in header if col in USED_COLS]
+        df = read_cases_csv(usecols)
         
         print(f"Successfully loaded CSV with shape: {df.shape}")
         print(f"Columns found: {list(df.columns)}")
@@ -43,49 +248,30 @@ def load_data():
             print("ERROR: CSV file is empty!")
             return create_sample_data()
         
-        # Clean up any potential BOM characters from the CSV
-        df.columns = df.columns.str.replace('\ufeff', '')
-        
-        # Convert dates to datetime if columns exist
-        if 'FileDate' in df.columns:
-            try:
-                df['FileDate'] = pd.to_datetime(df['FileDate'])
-                print("Successfully converted FileDate to datetime")
-            except:
-                print("Warning: Could not convert FileDate to datetime")
-        
-        if 'OffenseDate' in df.columns:
-            try:
-                df['OffenseDate'] = pd.to_datetime(df['OffenseDate'])
-                print("Successfully converted OffenseDate to datetime")
-            except:
-                print("Warning: Could not convert OffenseDate to datetime")
-        
         # Clean up text fields by stripping whitespace for existing columns
         text_columns = ['Gender', 'Race_Tier_1', 'Lead_Agency', 'ChargeOffenseDescription', 'Lead_Officer', 'Statute_Description', 'Statute']
         for col in text_columns:
             if col in df.columns:
                 try:
-                    df[col] = df[col].astype(str).str.strip()
+                    if isinstance(df[col].dtype, pd.CategoricalDtype):
+                        df[col] = strip_categories(df[col])
+                    else:
+                        df[col] = df[col].astype(str).str.strip()
                     print(f"Cleaned column: {col}")
                 except:
                     print(f"Warning: Could not clean column: {col}")
         
         # Handle missing values for existing columns
         if 'City_Clean' in df.columns:
-            df['City_Clean'] = df['City_Clean'].fillna('Unknown')
+            df['City_Clean'] = fill_missing(df['City_Clean'], 'Unknown')
         if 'Lead_Agency' in df.columns:
-            df['Lead_Agency'] = df['Lead_Agency'].fillna('Unknown')
+            df['Lead_Agency'] = fill_missing(df['Lead_Agency'], 'Unknown')
         if 'Lead_Officer' in df.columns:
-            df['Lead_Officer'] = df['Lead_Officer'].fillna('Unknown')
+            df['Lead_Officer'] = fill_missing(df['Lead_Officer'], 'Unknown')
         
-        # Create officer case counts for analysis
-        if 'Lead_Officer' in df.columns:
-            df['Officer_Case_Count'] = df.groupby('Lead_Officer')['CaseNumber'].transform('count')
+        df = add_derived_columns(convert_categories(df))
         
-        # Flag 790.07 cases
-        if 'Statute' in df.columns:
-            df['Is_790_07'] = df['Statute'].str.contains('790.07', na=False)
+        save_parquet(df)
         
         print(f"Data loaded successfully with {len(df)} rows and {len(df.columns)} columns")
         return df
@@ -146,27 +332,701 @@ def create_sample_data():
         'YearMonth': ['2024-01', '2024-01', '2024-01', '2024-01', '2024-01'],
         'OffenseWeekday': ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
     }
-    df = pd.DataFrame(sample_data)
-    df['Officer_Case_Count'] = df.groupby('Lead_Officer')['CaseNumber'].transform('count')
-    df['Is_790_07'] = df['Statute'].str.contains('790.07', na=False)
-    return df
+    return add_derived_columns(convert_categories(pd.DataFrame(sample_data)))
 
 # Load the data
 print("Starting data load...")
 df = load_data()
 
+# Which columns the loaded data has, checked once instead of in every chart builder
+SCHEMA = {col: col in df.columns for col in USED_COLS + ['Officer_Case_Count', 'Is_790_07']}
+
+# Columns backing the dropdown filters, in callback argument order
+FILTER_COLUMNS = ['Lead_Agency', 'Lead_Officer', 'Statute_Description', 'Statute_CaseType',
+                  'Gender', 'Race_Tier_1', 'Arrest_vs_NonArrest']
+
+# Extract the filter columns once so callbacks skip pandas indexing: categorical columns
+# as contiguous integer code arrays (int8 for small category sets), others as plain arrays
+FILTER_CODES = {col: (df[col].cat.codes.to_numpy(copy=True), df[col].cat.categories)
+                for col in FILTER_COLUMNS
+                if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype)}
+FILTER_ARRAYS = {col: df[col].values for col in FILTER_COLUMNS
+                 if col in df.columns and col not in FILTER_CODES}
+IS_790_ARRAY = df['Is_790_07'].values if 'Is_790_07' in df.columns else None
+
+def build_postings(codes, n_categories):
+    """
+    Build the posting list of every category: the ascending row positions holding
+    that code. One stable argsort groups the rows, and each list is a view into it.
+    """
+    order = np.argsort(codes, kind='stable')
+    counts = np.bincount(codes[codes >= 0], minlength=n_categories)
+    # Missing values (code -1) sort first and belong to no list
+    offsets = np.count_nonzero(codes < 0) + np.concatenate(([0], np.cumsum(counts)))
+    return [order[offsets[i]:offsets[i + 1]] for i in range(n_categories)]
+
+# Row positions per category of each categorical filter column
+FILTER_POSTINGS = {col: build_postings(codes, len(categories))
+                   for col, (codes, categories) in FILTER_CODES.items()}
+
+# Ages as a contiguous array (NaN where missing) and the fixed 790.07 histogram bins,
+# so each callback only runs np.histogram over the selected rows
+AGE_ARRAY = df['Age_At_Offense'].to_numpy(dtype=np.float32, na_value=np.nan) if 'Age_At_Offense' in df.columns else None
+AGE_BINS = np.arange(0, 101, 4)
+AGE_CENTERS = ((AGE_BINS[:-1] + AGE_BINS[1:]) / 2).tolist()
+AGE_WIDTHS = np.diff(AGE_BINS).tolist()
+
+# Header metrics, computed once after load
+TOTAL_CASES = len(df)
+CASE_TYPE_COUNTS = df['Statute_CaseType'].value_counts() if 'Statute_CaseType' in df.columns else pd.Series(dtype='int64')
+N_FELONY = int(CASE_TYPE_COUNTS.get('Felony', 0))
+N_AGENCIES = df['Lead_Agency'].nunique() if 'Lead_Agency' in df.columns else 0
+N_OFFICERS = df['Lead_Officer'].nunique() if 'Lead_Officer' in df.columns else 0
+N_790 = int(IS_790_ARRAY.sum()) if IS_790_ARRAY is not None else 0
+AVG_AGE = f"{np.nanmean(AGE_ARRAY):.1f}" if AGE_ARRAY is not None and len(df) > 0 else "N/A"
+
+# Category codes for the chart columns tallied with np.bincount
+COUNT_CODES = {col: (df[col].cat.codes.values, df[col].cat.categories)
+               for col in ['Statute_CaseType', 'Lead_Agency', 'Lead_Officer', 'Statute_Description']
+               if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype)}
+
+def json_ready(series):
+    """
+    Convert a column to an object array of JSON-native values: dates become the
+    ISO strings the encoder would produce, and missing values become None
+    """
+    values = series
+    if pd.api.types.is_datetime64_any_dtype(series):
+        values = series.dt.strftime('%Y-%m-%dT%H:%M:%S')
+    return values.astype(object).where(series.notna(), None).to_numpy()
+
+# Detailed case table as one row-major object matrix of JSON-ready Python values, so a
+# page of records is a single row gather and cells need no Timestamp or NumPy conversion
+TABLE_COLUMNS = [col for col in ['CaseNumber', 'Lead_Officer', 'Lead_Agency', 'Statute', 'Statute_Description',
+                                 'Statute_CaseType', 'Gender', 'Race_Tier_1', 'Age_At_Offense', 'FileDate', 'City_Clean']
+                 if col in df.columns]
+TABLE_RECORDS = np.empty((len(df), len(TABLE_COLUMNS)), dtype=object)
+for position, col in enumerate(TABLE_COLUMNS):
+    TABLE_RECORDS[:, position] = json_ready(df[col])
+
+# Per-row month codes for the timeline, counted from the earliest filing month, and the
+# continuous month labels they index. Derived from FileDate as integer month ordinals so
+# no string YearMonth has to be hashed; factorizing YearMonth is the fallback.
+MONTH_CODES = None
+try:
+    file_months = df['FileDate'].to_numpy(dtype='datetime64[M]')
+    has_month = ~np.isnat(file_months)
+    month_ordinals = file_months.astype(np.int64)
+    first_month, last_month = month_ordinals[has_month].min(), month_ordinals[has_month].max()
+    MONTH_CODES = np.where(has_month, month_ordinals - first_month, -1).astype(np.int16)
+    MONTH_LABELS = pd.period_range(start=str(file_months[has_month].min()),
+                                   periods=last_month - first_month + 1, freq='M').strftime('%Y-%m')
+except Exception as e:
+    print(f"Warning: Could not derive month codes from FileDate: {e}")
+    if 'YearMonth' in df.columns:
+        month_codes, MONTH_LABELS = pd.factorize(df['YearMonth'], sort=True)
+        MONTH_CODES = month_codes.astype(np.int16)
+
+# Category codes for the demographics cross-tab
+if 'Race_Tier_1' in df.columns and 'Gender' in df.columns:
+    RACE_CODES = df['Race_Tier_1'].cat.codes.values
+    RACE_CATEGORIES = df['Race_Tier_1'].cat.categories
+    GENDER_CODES = df['Gender'].cat.codes.values
+    GENDER_CATEGORIES = df['Gender'].cat.categories
+
 # Safely get unique values for dropdowns
 def safe_get_unique(column_name):
-    """Safely get unique values from a column"""
+    """
+    Safely get unique values from a column. Categorical columns return their
+    categories directly instead of scanning every row for unique values.
+    """
     if column_name in df.columns:
         try:
+            if isinstance(df[column_name].dtype, pd.CategoricalDtype):
+                categories = df[column_name].cat.categories
+                return categories[categories != ''].tolist()
             return [val for val in df[column_name].dropna().unique() if val and str(val) != 'nan']
         except:
             return []
     return []
 
+def build_options(column_name, all_label, label=lambda val: val):
+    """Build dropdown options for a column"""
+    values = safe_get_unique(column_name)
+    return [{'label': all_label, 'value': 'all'}] + [{'label': label(val), 'value': val} for val in values]
+
+# Static dropdown options, computed once after load
+DROPDOWN_OPTIONS = {
+    'Lead_Agency': build_options('Lead_Agency', 'All Agencies'),
+    'Lead_Officer': build_options('Lead_Officer', 'All Officers'),
+    'Statute_Description': build_options('Statute_Description', 'All Statutes'),
+    'Statute_CaseType': build_options('Statute_CaseType', 'All Types'),
+    'Gender': build_options('Gender', 'All Genders',
+                            lambda gender: 'Male' if gender == 'M' else 'Female' if gender == 'F' else gender),
+    'Race_Tier_1': build_options('Race_Tier_1', 'All Races'),
+    'Arrest_vs_NonArrest': build_options('Arrest_vs_NonArrest', 'All Types')
+}
+
+# Officer dropdown options per agency, from one groupby after load
+AGENCY_OFFICER_OPTIONS = {}
+if 'Lead_Agency' in df.columns and 'Lead_Officer' in df.columns:
+    try:
+        for agency, officers in df.groupby('Lead_Agency', observed=True)['Lead_Officer'].unique().items():
+            AGENCY_OFFICER_OPTIONS[agency] = [{'label': 'All Officers', 'value': 'all'}] + [
+                {'label': officer, 'value': officer} for officer in officers if officer and str(officer) != 'nan']
+    except Exception as e:
+        print(f"Warning: Could not group officers by agency: {e}")
+
+@functools.lru_cache(maxsize=256)
+def _filter_indices(selected_agency, selected_officer, selected_statute, selected_case_type,
+                    selected_gender, selected_race, selected_arrest, selected_790):
+    """
+    Return the row positions of df matching the filter selections.
+    Starts from the shortest posting list among the categorical filters and
+    narrows it with the remaining filters, so the work scales with the result
+    rather than with the number of rows.
+    """
+    selections = (selected_agency, selected_officer, selected_statute, selected_case_type,
+                  selected_gender, selected_race, selected_arrest)
+    
+    # Collect the (array, value, posting list) comparison of each active filter
+    comparisons = []
+    matches_nothing = False
+    for column, selected in zip(FILTER_COLUMNS, selections):
+        if selected == 'all':
+            continue
+        if column in FILTER_CODES:
+            # Compare integer codes; a value that is not a category matches nothing
+            codes, categories = FILTER_CODES[column]
+            code = categories.get_indexer([selected])[0]
+            if code < 0:
+                matches_nothing = True
+                break
+            comparisons.append((codes, code, FILTER_POSTINGS[column][code]))
+        elif column in FILTER_ARRAYS:
+            comparisons.append((FILTER_ARRAYS[column], selected, None))
+    
+    if selected_790 in ('yes', 'no') and IS_790_ARRAY is not None:
+        comparisons.append((IS_790_ARRAY, selected_790 == 'yes', None))
+    
+    if matches_nothing:
+        idx = np.array([], dtype=np.intp)
+    elif not comparisons:
+        idx = np.arange(len(df))
+    else:
+        # Seed with the smallest posting list, or a full scan when no categorical
+        # filter is active, then keep the candidates matching every other filter
+        indexed = [comparison for comparison in comparisons if comparison[2] is not None]
+        if indexed:
+            first = min(indexed, key=lambda comparison: len(comparison[2]))
+            idx = first[2]
+        else:
+            first = comparisons[0]
+            idx = np.flatnonzero(np.equal(first[0], first[1]))
+        for comparison in comparisons:
+            if comparison is not first:
+                values, value, _ = comparison
+                idx = idx[values[idx] == value]
+        # Copy so the cached result never aliases a posting list
+        idx = np.array(idx)
+    
+    # The cached array is shared between callbacks, so guard it against mutation
+    idx.flags.writeable = False
+    return idx
+
+# Columns the secondary table reads from the filtered rows; the charts work on row positions
+SELECTED_COLUMNS = [col for col in ['CaseNumber', 'Lead_Officer', 'Statute_Description', 'ChargeOffenseDescription',
+                                    'Gender', 'Race_Tier_1', 'Age_At_Offense', 'Is_790_07']
+                    if SCHEMA[col]]
+SELECTED_POSITIONS = df.columns.get_indexer(SELECTED_COLUMNS)
+
+def _select_rows(idx):
+    """
+    Return the rows of df at the given positions, limited to SELECTED_COLUMNS so
+    only the columns that are read get gathered. When every row is selected (no
+    active filters) df itself is returned, since callers only read from it.
+    """
+    if len(idx) == len(df):
+        return df
+    return df.iloc[idx, SELECTED_POSITIONS]
+
+@functools.lru_cache(maxsize=256)
+def _category_counts(filters):
+    """
+    Tally every categorical chart column for a filter combination in one pass
+    over the shared row positions, using np.bincount on the category codes
+    """
+    idx = _filter_indices(*filters)
+    counts = {}
+    for column, (codes, categories) in COUNT_CODES.items():
+        selected = codes[idx]
+        counts[column] = np.bincount(selected[selected >= 0], minlength=len(categories))
+    return counts
+
+def top_k(counts, k):
+    """
+    Return the positions of the k largest counts, largest first. A stable sort
+    breaks ties in category order, so the cut at the k-th count is deterministic.
+    """
+    return np.argsort(-counts, kind='stable')[:k]
+
+@functools.lru_cache(maxsize=1024)
+def _value_counts(column, filters, k=None):
+    """
+    Return the (top k) value counts of a column for a filter combination,
+    cached so revisiting a selection skips the aggregation
+    """
+    if column in COUNT_CODES:
+        category_counts = _category_counts(filters)[column]
+        top = top_k(category_counts, k)
+        counts = pd.Series(category_counts[top], index=COUNT_CODES[column][1][top])
+    else:
+        counts = df[column].take(_filter_indices(*filters)).value_counts().head(k)
+    # Drop categories that do not occur in the selection
+    return counts[counts > 0]
+
+# Shared chart template: the styling of Plotly's default theme that these charts use,
+# keeping only pie automargin from its per-trace-type entries, so each shell carries
+# a few hundred bytes of template instead of a full copy of the default theme
+AXIS_STYLE = {'gridcolor': 'white', 'linecolor': 'white', 'zerolinecolor': 'white', 'zerolinewidth': 2,
+              'ticks': '', 'automargin': True, 'title': {'standoff': 15}}
+pio.templates['dashboard'] = go.layout.Template(layout={
+    'colorway': pio.templates['plotly'].layout.colorway,
+    'font': {'color': '#2a3f5f'},
+    'title': {'x': 0.05},
+    'hovermode': 'closest',
+    'paper_bgcolor': 'white',
+    'plot_bgcolor': '#E5ECF6',
+    'xaxis': AXIS_STYLE,
+    'yaxis': AXIS_STYLE,
+    'coloraxis': {'colorbar': {'outlinewidth': 0, 'ticks': ''}}
+}, data={'pie': [{'automargin': True}]})
+
+# Chart shells rendered once at layout time; the callback only patches their data.
+# They are validated once here and stored as plain dicts, so serving the layout
+# does not walk the Figure objects again. uirevision keeps zoom, legend and
+# hover state in the browser while the data is patched.
+OFFICER_FIG = go.Figure(
+    go.Bar(orientation='h', marker={'coloraxis': 'coloraxis'}),
+    layout={
+        'template': 'dashboard',
+        'title': {'text': "Top 15 Officers by Case Volume"},
+        'uirevision': 'keep',
+        'xaxis': {'title': {'text': 'Number of Cases'}},
+        'yaxis': {'title': {'text': 'Officer'}},
+        'coloraxis': {'colorscale': 'Blues'},
+        'showlegend': False,
+        'height': 350
+    }
+).to_dict()
+
+STATUTE_FIG = go.Figure(
+    go.Pie(),
+    layout={'template': 'dashboard', 'title': {'text': "Statute Distribution"}, 'uirevision': 'keep'}
+).to_dict()
+
+DEMOGRAPHICS_FIG = go.Figure(
+    layout={
+        'template': 'dashboard',
+        'title': {'text': "Demographics: Race and Gender"},
+        'uirevision': 'keep',
+        'xaxis': {'title': {'text': 'Race'}},
+        'yaxis': {'title': {'text': 'Number of Cases'}},
+        'legend': {'title': {'text': 'Gender'}},
+        'barmode': 'relative'
+    }
+).to_dict()
+
+ANALYSIS_790_FIG = go.Figure(
+    go.Bar(marker={'color': '#e74c3c'}),
+    layout={
+        'template': 'dashboard',
+        'title': {'text': "Age Distribution for 790.07 Cases"},
+        'uirevision': 'keep',
+        'xaxis': {'title': {'text': 'Age at Offense'}},
+        'yaxis': {'title': {'text': 'Number of Cases'}},
+        'bargap': 0
+    }
+).to_dict()
+
+CASE_TYPE_FIG = go.Figure(
+    go.Pie(),
+    layout={
+        'template': 'dashboard',
+        'title': {'text': "Case Type Distribution"},
+        'uirevision': 'keep',
+        'piecolorway': ['#e74c3c', '#f39c12', '#27ae60']
+    }
+).to_dict()
+
+TIMELINE_FIG = go.Figure(
+    go.Scattergl(mode='lines+markers', line={'color': '#e74c3c', 'width': 3}),
+    layout={
+        'template': 'dashboard',
+        'title': {'text': "Cases Over Time"},
+        'uirevision': 'keep',
+        'xaxis': {'title': {'text': 'Year-Month'}, 'tickangle': 45},
+        'yaxis': {'title': {'text': 'Number of Cases'}}
+    }
+).to_dict()
+
+AGENCY_FIG = go.Figure(
+    go.Bar(marker={'coloraxis': 'coloraxis'}),
+    layout={
+        'template': 'dashboard',
+        'title': {'text': "Top 10 Agencies by Case Volume"},
+        'uirevision': 'keep',
+        'xaxis': {'title': {'text': 'Agency'}, 'tickangle': -45},
+        'yaxis': {'title': {'text': 'Number of Cases'}},
+        'coloraxis': {'colorscale': 'Viridis'},
+        'showlegend': False,
+        'height': 350
+    }
+).to_dict()
+
+GENDER_COLORS = {'M': '#3498db', 'F': '#e91e63'}
+
+def trace_patch(title, **trace_values):
+    """Build a Patch that swaps the chart title and the first trace's data"""
+    patch = Patch()
+    patch['layout']['title']['text'] = title
+    for key, value in trace_values.items():
+        patch['data'][0][key] = value
+    return patch
+
+def traces_patch(title, traces):
+    """Build a Patch that swaps the chart title and replaces all traces"""
+    patch = Patch()
+    patch['layout']['title']['text'] = title
+    patch['data'] = traces
+    return patch
+
+@functools.lru_cache(maxsize=None)
+def empty_patch(title, keys=('x', 'y')):
+    """
+    Build, once per title, the Patch that empties a chart and shows a status
+    title: clearing the given first-trace keys, or every trace when keys is None
+    """
+    if keys is None:
+        return traces_patch(title, [])
+    return trace_patch(title, **{key: [] for key in keys})
+
+def build_officer_chart(filters, empty):
+    """Officer performance bar chart"""
+    if SCHEMA['Lead_Officer'] and not empty:
+        try:
+            officer_counts = _value_counts('Lead_Officer', filters, 15)
+            if len(officer_counts) > 0:
+                return trace_patch(
+                    "Top 15 Officers by Case Volume",
+                    x=officer_counts.values.tolist(),
+                    y=officer_counts.index.tolist(),
+                    marker={'color': officer_counts.values.tolist(), 'coloraxis': 'coloraxis'}
+                )
+            else:
+                return empty_patch("Officer Performance (No data)")
+        except:
+            return empty_patch("Officer Performance (Error)")
+    else:
+        return empty_patch("Officer Performance (No data available)")
+
+def build_statute_chart(filters, empty):
+    """Statute distribution pie chart"""
+    if SCHEMA['Statute_Description'] and not empty:
+        try:
+            statute_counts = _value_counts('Statute_Description', filters, 10)
+            if len(statute_counts) > 0:
+                return trace_patch(
+                    "Statute Distribution",
+                    labels=statute_counts.index.tolist(),
+                    values=statute_counts.values.tolist()
+                )
+            else:
+                return empty_patch("Statute Distribution (No data)", ('labels', 'values'))
+        except:
+            return empty_patch("Statute Distribution (Error)", ('labels', 'values'))
+    else:
+        return empty_patch("Statute Distribution (No data available)", ('labels', 'values'))
+
+def build_demographics_chart(filters, empty):
+    """Race and gender stacked bar chart"""
+    if SCHEMA['Race_Tier_1'] and SCHEMA['Gender'] and not empty:
+        try:
+            # Cross-tabulate race x gender directly on the category codes
+            idx = _filter_indices(*filters)
+            race_codes = RACE_CODES[idx]
+            gender_codes = GENDER_CODES[idx]
+            valid = (race_codes >= 0) & (gender_codes >= 0)
+            # Encode each (race, gender) pair as one integer and histogram them in a single bincount
+            n_race, n_gender = len(RACE_CATEGORIES), len(GENDER_CATEGORIES)
+            pair_codes = race_codes[valid].astype(np.intp) * n_gender + gender_codes[valid]
+            counts = np.bincount(pair_codes, minlength=n_race * n_gender).reshape(n_race, n_gender)
+            
+            if counts.any():
+                # One bar trace per gender, stacked by race
+                traces = []
+                for g, gender in enumerate(GENDER_CATEGORIES):
+                    observed = np.flatnonzero(counts[:, g])
+                    if len(observed) > 0:
+                        traces.append({'type': 'bar',
+                                       'name': str(gender),
+                                       'x': [str(race) for race in RACE_CATEGORIES[observed]],
+                                       'y': counts[observed, g].tolist(),
+                                       'marker': {'color': GENDER_COLORS.get(gender)}})
+                return traces_patch("Demographics: Race and Gender", traces)
+            else:
+                return empty_patch("Demographics (No data)", None)
+        except:
+            return empty_patch("Demographics (Error)", None)
+    else:
+        return empty_patch("Demographics (No data available)", None)
+
+def build_790_chart(filters, empty):
+    """Age histogram for 790.07 cases"""
+    if IS_790_ARRAY is not None and AGE_ARRAY is not None and not empty:
+        try:
+            idx = _filter_indices(*filters)
+            rows_790 = idx[IS_790_ARRAY[idx]]
+            if len(rows_790) > 0:
+                # Bin on the server over the fixed AGE_BINS so only the bar heights are sent
+                ages = AGE_ARRAY[rows_790]
+                age_counts, _ = np.histogram(ages[~np.isnan(ages)], bins=AGE_BINS)
+                return trace_patch(
+                    "Age Distribution for 790.07 Cases",
+                    x=AGE_CENTERS,
+                    y=age_counts.tolist(),
+                    width=AGE_WIDTHS
+                )
+            else:
+                return empty_patch("790.07 Analysis (No 790.07 cases found)")
+        except:
+            return empty_patch("790.07 Analysis (Error)")
+    else:
+        return empty_patch("790.07 Analysis (No data available)")
+
+def build_case_type_chart(filters, empty):
+    """Case type pie chart"""
+    if SCHEMA['Statute_CaseType'] and not empty:
+        try:
+            case_type_counts = _value_counts('Statute_CaseType', filters)
+            if len(case_type_counts) > 0:
+                return trace_patch(
+                    "Case Type Distribution",
+                    labels=case_type_counts.index.tolist(),
+                    values=case_type_counts.values.tolist()
+                )
+            else:
+                return empty_patch("Case Types (No data)", ('labels', 'values'))
+        except:
+            return empty_patch("Case Types (Error)", ('labels', 'values'))
+    else:
+        return empty_patch("Case Types (No data available)", ('labels', 'values'))
+
+def build_timeline_chart(filters, empty):
+    """Monthly case timeline"""
+    if MONTH_CODES is not None and not empty:
+        try:
+            # Count rows per month with a bincount over the precomputed month codes
+            month_codes = MONTH_CODES[_filter_indices(*filters)]
+            month_counts = np.bincount(month_codes[month_codes >= 0], minlength=len(MONTH_LABELS))
+            observed = np.flatnonzero(month_counts)
+            
+            if len(observed) > 0:
+                return trace_patch(
+                    "Cases Over Time",
+                    x=[str(month) for month in MONTH_LABELS[observed]],
+                    y=month_counts[observed].tolist()
+                )
+            else:
+                return empty_patch("Timeline (No data)")
+        except:
+            return empty_patch("Timeline (Error)")
+    else:
+        return empty_patch("Timeline (No data available)")
+
+def build_agency_chart(filters, empty):
+    """Agency bar chart"""
+    if SCHEMA['Lead_Agency'] and not empty:
+        try:
+            agency_counts = _value_counts('Lead_Agency', filters, 10)
+            if len(agency_counts) > 0:
+                return trace_patch(
+                    "Top 10 Agencies by Case Volume",
+                    x=agency_counts.index.tolist(),
+                    y=agency_counts.values.tolist(),
+                    marker={'color': agency_counts.values.tolist(), 'coloraxis': 'coloraxis'}
+                )
+            else:
+                return empty_patch("Agencies (No data)")
+        except:
+            return empty_patch("Agencies (Error)")
+    else:
+        return empty_patch("Agencies (No data available)")
+
+# Chart builders in callback output order
+CHART_BUILDERS = {
+    'officer': build_officer_chart,
+    'statute': build_statute_chart,
+    'demographics': build_demographics_chart,
+    '790': build_790_chart,
+    'case_type': build_case_type_chart,
+    'timeline': build_timeline_chart,
+    'agency': build_agency_chart
+}
+
+# Shared worker pool for building the charts and tables of one filter combination.
+# Sized to the cores available (override with CHART_WORKERS).
+CHART_WORKERS = int(os.environ.get('CHART_WORKERS', min(len(CHART_BUILDERS) + 1, os.cpu_count() or 1)))
+_executor = None
+_executor_lock = threading.Lock()
+
+def _reset_executor():
+    """Drop the pool inherited through fork; its worker threads do not exist in the child"""
+    global _executor, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_executor)
+
+def _get_executor():
+    """
+    Return this process's chart worker pool, creating it on first use so that
+    processes forked after import (e.g. gunicorn --preload) start their own threads
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=max(CHART_WORKERS, 1))
+    return _executor
+
+def _chart_payloads(filters, empty, parallel=True):
+    """
+    Build every chart patch for a filter combination in its serialized form
+    """
+    if not parallel:
+        return tuple(build(filters, empty).to_plotly_json() for build in CHART_BUILDERS.values())
+    # The builders are independent, so run them side by side
+    executor = _get_executor()
+    futures = [executor.submit(build, filters, empty) for build in CHART_BUILDERS.values()]
+    return tuple(future.result().to_plotly_json() for future in futures)
+
+def build_secondary_table(filtered_df):
+    """Secondary charges table (790.07 focus), returned as (data, columns)"""
+    secondary_data = []
+    secondary_columns = []
+    
+    if SCHEMA['Is_790_07'] and len(filtered_df) > 0:
+        try:
+            df_790 = filtered_df[filtered_df['Is_790_07'] == True]
+            if len(df_790) > 0:
+                # Only the first 50 case numbers are shown, so aggregate just their rows
+                case_numbers = df_790['CaseNumber'].drop_duplicates().dropna().sort_values().head(50)
+                df_790 = df_790[df_790['CaseNumber'].isin(case_numbers)]
+                
+                # Group by case number to see what other charges appear with 790.07:
+                # dedupe (case, value) pairs first so each join sees only distinct values
+                case_groups = df_790.groupby('CaseNumber')[['Lead_Officer', 'Age_At_Offense', 'Gender', 'Race_Tier_1']].first()
+                for col in ['Statute_Description', 'ChargeOffenseDescription']:
+                    distinct = df_790.dropna(subset=[col]).drop_duplicates(['CaseNumber', col])
+                    case_groups.insert(0, col, distinct.groupby('CaseNumber')[col].agg(', '.join))
+                
+                secondary_data = case_groups.reset_index().to_dict('records')
+                secondary_columns = [
+                    {"name": "Case Number", "id": "CaseNumber"},
+                    {"name": "Officer", "id": "Lead_Officer"},
+                    {"name": "All Charges", "id": "ChargeOffenseDescription"},
+                    {"name": "All Statutes", "id": "Statute_Description"},
+                    {"name": "Age", "id": "Age_At_Offense"},
+                    {"name": "Gender", "id": "Gender"},
+                    {"name": "Race", "id": "Race_Tier_1"}
+                ]
+        except Exception as e:
+            print(f"Error creating secondary charges table: {e}")
+    
+    return secondary_data, secondary_columns
+
+def build_cases_table(idx):
+    """Main cases table, assembled from the precomputed record matrix"""
+    if TABLE_COLUMNS and len(idx) > 0:
+        try:
+            return [dict(zip(TABLE_COLUMNS, record)) for record in TABLE_RECORDS[idx[:100]].tolist()]
+        except:
+            return [{'Message': 'Error loading table data'}]
+    return [{'Message': 'No data available for table'}]
+
+@functools.lru_cache(maxsize=256)
+def _rows_key(filters):
+    """Digest of the rows matching a filter combination"""
+    return hashlib.blake2b(_filter_indices(*filters).tobytes(), digest_size=16).hexdigest()
+
+def _compute_outputs(filters, parallel=True):
+    """
+    Compute every update_dashboard output for a filter combination: the seven
+    serialized chart patches followed by the secondary table data and columns
+    and the cases table data
+    """
+    idx = _filter_indices(*filters)
+    # Prime the shared counts so the builders read one cached tally instead of
+    # each missing the cache and recomputing it concurrently
+    _category_counts(filters)
+    filtered_df = _select_rows(idx)
+    if not parallel:
+        secondary_data, secondary_columns = build_secondary_table(filtered_df)
+        return (_chart_payloads(filters, len(idx) == 0, parallel=False)
+                + (secondary_data, secondary_columns, build_cases_table(idx)))
+    # The secondary table does not depend on the charts; build it alongside them
+    secondary_future = _get_executor().submit(build_secondary_table, filtered_df)
+    chart_payloads = _chart_payloads(filters, len(idx) == 0)
+    secondary_data, secondary_columns = secondary_future.result()
+    return chart_payloads + (secondary_data, secondary_columns, build_cases_table(idx))
+
+@functools.lru_cache(maxsize=512)
+def _dashboard_outputs(filters):
+    """
+    The outputs of _compute_outputs, cached per filter combination so repeat and
+    back-and-forth selections return without any aggregation or encoding
+    """
+    return _compute_outputs(filters)
+
+def apply_patch(figure, payload):
+    """Apply a serialized Patch of assignments to a copy of a figure dict"""
+    figure = copy.deepcopy(figure)
+    for operation in payload['operations']:
+        *path, key = operation['location']
+        target = figure
+        for part in path:
+            target = target[part]
+        target[key] = operation['params']['value']
+    return figure
+
+# The page first loads with every filter set to 'all'; render that state into the layout
+# so the dashboard callback does not need to run on page load
+DEFAULT_FILTERS = ('all',) * 8
+
+CHART_SHELLS = {
+    'officer': OFFICER_FIG,
+    'statute': STATUTE_FIG,
+    'demographics': DEMOGRAPHICS_FIG,
+    '790': ANALYSIS_790_FIG,
+    'case_type': CASE_TYPE_FIG,
+    'timeline': TIMELINE_FIG,
+    'agency': AGENCY_FIG
+}
+# Built serially: starting pool threads at import would leave a process forked
+# afterwards (gunicorn --preload) with threads it does not have
+INITIAL_OUTPUTS = _compute_outputs(DEFAULT_FILTERS, parallel=False)
+DEFAULT_ROWS_KEY = _rows_key(DEFAULT_FILTERS)
+INITIAL_FIGURES = {name: apply_patch(CHART_SHELLS[name], payload)
+                   for name, payload in zip(CHART_BUILDERS, INITIAL_OUTPUTS)}
+INITIAL_SECONDARY_DATA, INITIAL_SECONDARY_COLUMNS, INITIAL_TABLE_DATA = INITIAL_OUTPUTS[len(CHART_BUILDERS):]
+
 # Define the app layout
 app.layout = html.Div([
+    # Key of the rows currently rendered, used to skip no-op updates
+    dcc.Store(id='rows-key', data=DEFAULT_ROWS_KEY),
+    
     # Header section
     html.Div([
         html.H1("Enhanced Criminal Cases Dashboard", 
@@ -177,7 +1037,7 @@ app.layout = html.Div([
                     'fontFamily': 'Arial, sans-serif'
                 }),
         
-        html.P(f"Comprehensive analysis of {len(df):,} criminal cases with officer analytics",
+        html.P(f"Comprehensive analysis of {TOTAL_CASES:,} criminal cases with officer analytics",
                style={
                    'textAlign': 'center',
                    'color': '#7f8c8d',
@@ -189,32 +1049,32 @@ app.layout = html.Div([
     # Key metrics row
     html.Div([
         html.Div([
-            html.H3(f"{len(df):,}", style={'margin': '0', 'color': '#3498db', 'fontSize': '24px'}),
+            html.H3(f"{TOTAL_CASES:,}", style={'margin': '0', 'color': '#3498db', 'fontSize': '24px'}),
             html.P("Total Cases", style={'margin': '0', 'fontSize': '12px'})
         ], style={'textAlign': 'center', 'backgroundColor': '#ecf0f1', 'padding': '15px', 'borderRadius': '8px', 'width': '15%', 'display': 'inline-block', 'margin': '0.5%'}),
         
         html.Div([
-            html.H3(f"{len(df[df['Statute_CaseType'] == 'Felony']) if 'Statute_CaseType' in df.columns else 0}", style={'margin': '0', 'color': '#e74c3c', 'fontSize': '24px'}),
+            html.H3(f"{N_FELONY}", style={'margin': '0', 'color': '#e74c3c', 'fontSize': '24px'}),
             html.P("Felonies", style={'margin': '0', 'fontSize': '12px'})
         ], style={'textAlign': 'center', 'backgroundColor': '#ecf0f1', 'padding': '15px', 'borderRadius': '8px', 'width': '15%', 'display': 'inline-block', 'margin': '0.5%'}),
         
         html.Div([
-            html.H3(f"{df['Lead_Agency'].nunique() if 'Lead_Agency' in df.columns else 0}", style={'margin': '0', 'color': '#27ae60', 'fontSize': '24px'}),
+            html.H3(f"{N_AGENCIES}", style={'margin': '0', 'color': '#27ae60', 'fontSize': '24px'}),
             html.P("Agencies", style={'margin': '0', 'fontSize': '12px'})
         ], style={'textAlign': 'center', 'backgroundColor': '#ecf0f1', 'padding': '15px', 'borderRadius': '8px', 'width': '15%', 'display': 'inline-block', 'margin': '0.5%'}),
         
         html.Div([
-            html.H3(f"{df['Lead_Officer'].nunique() if 'Lead_Officer' in df.columns else 0}", style={'margin': '0', 'color': '#9b59b6', 'fontSize': '24px'}),
+            html.H3(f"{N_OFFICERS}", style={'margin': '0', 'color': '#9b59b6', 'fontSize': '24px'}),
             html.P("Officers", style={'margin': '0', 'fontSize': '12px'})
         ], style={'textAlign': 'center', 'backgroundColor': '#ecf0f1', 'padding': '15px', 'borderRadius': '8px', 'width': '15%', 'display': 'inline-block', 'margin': '0.5%'}),
         
         html.Div([
-            html.H3(f"{len(df[df.get('Is_790_07', False)]) if 'Is_790_07' in df.columns else 0}", style={'margin': '0', 'color': '#e67e22', 'fontSize': '24px'}),
+            html.H3(f"{N_790}", style={'margin': '0', 'color': '#e67e22', 'fontSize': '24px'}),
             html.P("790.07 Cases", style={'margin': '0', 'fontSize': '12px'})
         ], style={'textAlign': 'center', 'backgroundColor': '#ecf0f1', 'padding': '15px', 'borderRadius': '8px', 'width': '15%', 'display': 'inline-block', 'margin': '0.5%'}),
         
         html.Div([
-            html.H3(f"{df['Age_At_Offense'].mean():.1f}" if 'Age_At_Offense' in df.columns and len(df) > 0 else "N/A", style={'margin': '0', 'color': '#34495e', 'fontSize': '24px'}),
+            html.H3(AVG_AGE, style={'margin': '0', 'color': '#34495e', 'fontSize': '24px'}),
             html.P("Avg Age", style={'margin': '0', 'fontSize': '12px'})
         ], style={'textAlign': 'center', 'backgroundColor': '#ecf0f1', 'padding': '15px', 'borderRadius': '8px', 'width': '15%', 'display': 'inline-block', 'margin': '0.5%'})
     ], style={'padding': '0 15px', 'marginBottom': '20px'}),
@@ -227,8 +1087,7 @@ app.layout = html.Div([
                 html.Label("Agency:", style={'fontWeight': 'bold', 'marginBottom': '5px', 'fontSize': '14px'}),
                 dcc.Dropdown(
                     id='agency-filter',
-                    options=[{'label': 'All Agencies', 'value': 'all'}] + 
-                            [{'label': agency, 'value': agency} for agency in safe_get_unique('Lead_Agency')],
+                    options=DROPDOWN_OPTIONS['Lead_Agency'],
                     value='all',
                     style={'marginBottom': '10px', 'fontSize': '12px'}
                 )
@@ -248,8 +1107,7 @@ app.layout = html.Div([
                 html.Label("Statute Description:", style={'fontWeight': 'bold', 'marginBottom': '5px', 'fontSize': '14px'}),
                 dcc.Dropdown(
                     id='statute-filter',
-                    options=[{'label': 'All Statutes', 'value': 'all'}] + 
-                            [{'label': statute, 'value': statute} for statute in safe_get_unique('Statute_Description')],
+                    options=DROPDOWN_OPTIONS['Statute_Description'],
                     value='all',
                     style={'marginBottom': '10px', 'fontSize': '12px'}
                 )
@@ -259,8 +1117,7 @@ app.layout = html.Div([
                 html.Label("Case Type:", style={'fontWeight': 'bold', 'marginBottom': '5px', 'fontSize': '14px'}),
                 dcc.Dropdown(
                     id='case-type-filter',
-                    options=[{'label': 'All Types', 'value': 'all'}] + 
-                            [{'label': case_type, 'value': case_type} for case_type in safe_get_unique('Statute_CaseType')],
+                    options=DROPDOWN_OPTIONS['Statute_CaseType'],
                     value='all',
                     style={'marginBottom': '10px', 'fontSize': '12px'}
                 )
@@ -273,9 +1130,7 @@ app.layout = html.Div([
                 html.Label("Gender:", style={'fontWeight': 'bold', 'marginBottom': '5px', 'fontSize': '14px'}),
                 dcc.Dropdown(
                     id='gender-filter',
-                    options=[{'label': 'All Genders', 'value': 'all'}] + 
-                            [{'label': 'Male' if gender == 'M' else 'Female' if gender == 'F' else gender, 'value': gender} 
-                             for gender in safe_get_unique('Gender')],
+                    options=DROPDOWN_OPTIONS['Gender'],
                     value='all',
                     style={'marginBottom': '10px', 'fontSize': '12px'}
                 )
@@ -285,8 +1140,7 @@ app.layout = html.Div([
                 html.Label("Race:", style={'fontWeight': 'bold', 'marginBottom': '5px', 'fontSize': '14px'}),
                 dcc.Dropdown(
                     id='race-filter',
-                    options=[{'label': 'All Races', 'value': 'all'}] + 
-                            [{'label': race, 'value': race} for race in safe_get_unique('Race_Tier_1')],
+                    options=DROPDOWN_OPTIONS['Race_Tier_1'],
                     value='all',
                     style={'marginBottom': '10px', 'fontSize': '12px'}
                 )
@@ -296,8 +1150,7 @@ app.layout = html.Div([
                 html.Label("Arrest Type:", style={'fontWeight': 'bold', 'marginBottom': '5px', 'fontSize': '14px'}),
                 dcc.Dropdown(
                     id='arrest-filter',
-                    options=[{'label': 'All Types', 'value': 'all'}] + 
-                            [{'label': arrest_type, 'value': arrest_type} for arrest_type in safe_get_unique('Arrest_vs_NonArrest')],
+                    options=DROPDOWN_OPTIONS['Arrest_vs_NonArrest'],
                     value='all',
                     style={'marginBottom': '10px', 'fontSize': '12px'}
                 )
@@ -323,34 +1176,34 @@ app.layout = html.Div([
     html.Div([
         # First row - Officer Analytics
         html.Div([
-            dcc.Graph(id='officer-performance-chart', style={'height': '350px'})
+            dcc.Graph(id='officer-performance-chart', figure=INITIAL_FIGURES['officer'], style={'height': '350px'})
         ], style={'width': '50%', 'display': 'inline-block', 'padding': '10px'}),
         
         html.Div([
-            dcc.Graph(id='statute-breakdown-chart', style={'height': '350px'})
+            dcc.Graph(id='statute-breakdown-chart', figure=INITIAL_FIGURES['statute'], style={'height': '350px'})
         ], style={'width': '50%', 'display': 'inline-block', 'padding': '10px'}),
         
         # Second row - Demographics and 790.07 Analysis
         html.Div([
-            dcc.Graph(id='demographics-chart', style={'height': '350px'})
+            dcc.Graph(id='demographics-chart', figure=INITIAL_FIGURES['demographics'], style={'height': '350px'})
         ], style={'width': '50%', 'display': 'inline-block', 'padding': '10px'}),
         
         html.Div([
-            dcc.Graph(id='790-analysis-chart', style={'height': '350px'})
+            dcc.Graph(id='790-analysis-chart', figure=INITIAL_FIGURES['790'], style={'height': '350px'})
         ], style={'width': '50%', 'display': 'inline-block', 'padding': '10px'}),
         
         # Third row - Case Type and Timeline
         html.Div([
-            dcc.Graph(id='case-type-chart', style={'height': '350px'})
+            dcc.Graph(id='case-type-chart', figure=INITIAL_FIGURES['case_type'], style={'height': '350px'})
         ], style={'width': '50%', 'display': 'inline-block', 'padding': '10px'}),
         
         html.Div([
-            dcc.Graph(id='timeline-chart', style={'height': '350px'})
+            dcc.Graph(id='timeline-chart', figure=INITIAL_FIGURES['timeline'], style={'height': '350px'})
         ], style={'width': '50%', 'display': 'inline-block', 'padding': '10px'}),
         
         # Fourth row - Agency Analysis
         html.Div([
-            dcc.Graph(id='agency-chart', style={'height': '350px'})
+            dcc.Graph(id='agency-chart', figure=INITIAL_FIGURES['agency'], style={'height': '350px'})
         ], style={'width': '100%', 'padding': '10px'}),
         
         # Data tables section
@@ -359,8 +1212,8 @@ app.layout = html.Div([
                    style={'textAlign': 'center', 'marginBottom': '15px', 'color': '#2c3e50'}),
             dash_table.DataTable(
                 id='secondary-charges-table',
-                columns=[],
-                data=[],
+                columns=INITIAL_SECONDARY_COLUMNS,
+                data=INITIAL_SECONDARY_DATA,
                 style_cell={'textAlign': 'left', 'padding': '8px', 'fontSize': '11px'},
                 style_header={'backgroundColor': '#e74c3c', 'color': 'white', 'fontWeight': 'bold'},
                 style_data={'backgroundColor': '#fadbd8'},
@@ -388,7 +1241,7 @@ app.layout = html.Div([
                     {"name": "File Date", "id": "FileDate"},
                     {"name": "City", "id": "City_Clean"}
                 ],
-                data=[],
+                data=INITIAL_TABLE_DATA,
                 style_cell={'textAlign': 'left', 'padding': '8px', 'fontSize': '11px'},
                 style_header={'backgroundColor': '#3498db', 'color': 'white', 'fontWeight': 'bold'},
                 style_data={'backgroundColor': '#ecf0f1'},
@@ -407,15 +1260,8 @@ app.layout = html.Div([
 )
 def update_officer_dropdown(selected_agency):
     if selected_agency == 'all' or not selected_agency:
-        officers = safe_get_unique('Lead_Officer')
-    else:
-        if 'Lead_Agency' in df.columns and 'Lead_Officer' in df.columns:
-            agency_df = df[df['Lead_Agency'] == selected_agency]
-            officers = [val for val in agency_df['Lead_Officer'].dropna().unique() if val and str(val) != 'nan']
-        else:
-            officers = []
-    
-    return [{'label': 'All Officers', 'value': 'all'}] + [{'label': officer, 'value': officer} for officer in officers]
+        return DROPDOWN_OPTIONS['Lead_Officer']
+    return AGENCY_OFFICER_OPTIONS.get(selected_agency, [{'label': 'All Officers', 'value': 'all'}])
 
 # Main callback for updating all charts and tables
 @app.callback(
@@ -428,7 +1274,8 @@ def update_officer_dropdown(selected_agency):
      Output('agency-chart', 'figure'),
      Output('secondary-charges-table', 'data'),
      Output('secondary-charges-table', 'columns'),
-     Output('cases-table', 'data')],
+     Output('cases-table', 'data'),
+     Output('rows-key', 'data')],
     [Input('agency-filter', 'value'),
      Input('officer-filter', 'value'),
      Input('statute-filter', 'value'),
@@ -436,230 +1283,32 @@ def update_officer_dropdown(selected_agency):
      Input('gender-filter', 'value'),
      Input('race-filter', 'value'),
      Input('arrest-filter', 'value'),
-     Input('790-filter', 'value')]
+     Input('790-filter', 'value')],
+    [State('rows-key', 'data')],
+    # The initial state is rendered into the layout
+    prevent_initial_call=True
 )
 def update_dashboard(selected_agency, selected_officer, selected_statute, selected_case_type, 
-                    selected_gender, selected_race, selected_arrest, selected_790):
+                    selected_gender, selected_race, selected_arrest, selected_790, current_rows_key):
     """
     Update all dashboard components based on filter selections
     """
-    # Filter data based on selections
-    filtered_df = df.copy()
-    
-    if selected_agency != 'all' and 'Lead_Agency' in df.columns:
-        filtered_df = filtered_df[filtered_df['Lead_Agency'] == selected_agency]
-    
-    if selected_officer != 'all' and 'Lead_Officer' in df.columns:
-        filtered_df = filtered_df[filtered_df['Lead_Officer'] == selected_officer]
-    
-    if selected_statute != 'all' and 'Statute_Description' in df.columns:
-        filtered_df = filtered_df[filtered_df['Statute_Description'] == selected_statute]
-    
-    if selected_case_type != 'all' and 'Statute_CaseType' in df.columns:
-        filtered_df = filtered_df[filtered_df['Statute_CaseType'] == selected_case_type]
+    # Filter data based on selections (row positions are cached per filter combination)
+    filters = (selected_agency, selected_officer, selected_statute, selected_case_type,
+               selected_gender, selected_race, selected_arrest, selected_790)
     
-    if selected_gender != 'all' and 'Gender' in df.columns:
-        filtered_df = filtered_df[filtered_df['Gender'] == selected_gender]
+    # Nothing to redraw when the selection matches the rows already shown
+    rows_key = _rows_key(filters)
+    if rows_key == current_rows_key:
+        raise PreventUpdate
     
-    if selected_race != 'all' and 'Race_Tier_1' in df.columns:
-        filtered_df = filtered_df[filtered_df['Race_Tier_1'] == selected_race]
-    
-    if selected_arrest != 'all' and 'Arrest_vs_NonArrest' in df.columns:
-        filtered_df = filtered_df[filtered_df['Arrest_vs_NonArrest'] == selected_arrest]
-    
-    if selected_790 == 'yes' and 'Is_790_07' in df.columns:
-        filtered_df = filtered_df[filtered_df['Is_790_07'] == True]
-    elif selected_790 == 'no' and 'Is_790_07' in df.columns:
-        filtered_df = filtered_df[filtered_df['Is_790_07'] == False]
-    
-    # Officer Performance Chart
-    if 'Lead_Officer' in filtered_df.columns and len(filtered_df) > 0:
-        try:
-            officer_counts = filtered_df['Lead_Officer'].value_counts().head(15)
-            if len(officer_counts) > 0:
-                officer_fig = px.bar(
-                    x=officer_counts.values,
-                    y=officer_counts.index,
-                    orientation='h',
-                    title="Top 15 Officers by Case Volume",
-                    labels={'x': 'Number of Cases', 'y': 'Officer'},
-                    color=officer_counts.values,
-                    color_continuous_scale='Blues'
-                )
-                officer_fig.update_layout(showlegend=False, height=350)
-            else:
-                officer_fig = px.bar(title="Officer Performance (No data)")
-        except:
-            officer_fig = px.bar(title="Officer Performance (Error)")
-    else:
-        officer_fig = px.bar(title="Officer Performance (No data available)")
-    
-    # Statute Breakdown Chart
-    if 'Statute_Description' in filtered_df.columns and len(filtered_df) > 0:
-        try:
-            statute_counts = filtered_df['Statute_Description'].value_counts().head(10)
-            if len(statute_counts) > 0:
-                statute_fig = px.pie(
-                    values=statute_counts.values,
-                    names=statute_counts.index,
-                    title="Statute Distribution"
-                )
-            else:
-                statute_fig = px.pie(title="Statute Distribution (No data)")
-        except:
-            statute_fig = px.pie(title="Statute Distribution (Error)")
-    else:
-        statute_fig = px.pie(title="Statute Distribution (No data available)")
-    
-    # Demographics Chart
-    if 'Race_Tier_1' in filtered_df.columns and 'Gender' in filtered_df.columns and len(filtered_df) > 0:
-        try:
-            demo_df = filtered_df.groupby(['Race_Tier_1', 'Gender']).size().reset_index(name='count')
-            if len(demo_df) > 0:
-                demographics_fig = px.bar(
-                    demo_df,
-                    x='Race_Tier_1',
-                    y='count',
-                    color='Gender',
-                    title="Demographics: Race and Gender",
-                    labels={'Race_Tier_1': 'Race', 'count': 'Number of Cases'},
-                    color_discrete_map={'M': '#3498db', 'F': '#e91e63'}
-                )
-            else:
-                demographics_fig = px.bar(title="Demographics (No data)")
-        except:
-            demographics_fig = px.bar(title="Demographics (Error)")
-    else:
-        demographics_fig = px.bar(title="Demographics (No data available)")
-    
-    # 790.07 Analysis Chart
-    if 'Is_790_07' in filtered_df.columns and 'Age_At_Offense' in filtered_df.columns and len(filtered_df) > 0:
-        try:
-            df_790 = filtered_df[filtered_df['Is_790_07'] == True]
-            if len(df_790) > 0:
-                analysis_fig = px.histogram(
-                    df_790,
-                    x='Age_At_Offense',
-                    nbins=15,
-                    title="Age Distribution for 790.07 Cases",
-                    labels={'Age_At_Offense': 'Age at Offense', 'count': 'Number of Cases'},
-                    color_discrete_sequence=['#e74c3c']
-                )
-            else:
-                analysis_fig = px.histogram(title="790.07 Analysis (No 790.07 cases found)")
-        except:
-            analysis_fig = px.histogram(title="790.07 Analysis (Error)")
-    else:
-        analysis_fig = px.histogram(title="790.07 Analysis (No data available)")
-    
-    # Case Type Chart
-    if 'Statute_CaseType' in filtered_df.columns and len(filtered_df) > 0:
-        try:
-            case_type_counts = filtered_df['Statute_CaseType'].value_counts()
-            if len(case_type_counts) > 0:
-                case_type_fig = px.pie(
-                    values=case_type_counts.values,
-                    names=case_type_counts.index,
-                    title="Case Type Distribution",
-                    color_discrete_sequence=['#e74c3c', '#f39c12', '#27ae60']
-                )
-            else:
-                case_type_fig = px.pie(title="Case Types (No data)")
-        except:
-            case_type_fig = px.pie(title="Case Types (Error)")
-    else:
-        case_type_fig = px.pie(title="Case Types (No data available)")
-    
-    # Timeline Chart
-    if 'YearMonth' in filtered_df.columns and len(filtered_df) > 0:
-        try:
-            timeline_data = filtered_df.groupby('YearMonth').size().reset_index(name='count')
-            timeline_data = timeline_data.sort_values('YearMonth')
-            
-            if len(timeline_data) > 0:
-                timeline_fig = px.line(
-                    timeline_data,
-                    x='YearMonth',
-                    y='count',
-                    title="Cases Over Time",
-                    labels={'YearMonth': 'Year-Month', 'count': 'Number of Cases'},
-                    markers=True
-                )
-                timeline_fig.update_traces(line=dict(color='#e74c3c', width=3))
-                timeline_fig.update_xaxes(tickangle=45)
-            else:
-                timeline_fig = px.line(title="Timeline (No data)")
-        except:
-            timeline_fig = px.line(title="Timeline (Error)")
-    else:
-        timeline_fig = px.line(title="Timeline (No data available)")
-    
-    # Agency Chart
-    if 'Lead_Agency' in filtered_df.columns and len(filtered_df) > 0:
-        try:
-            agency_counts = filtered_df['Lead_Agency'].value_counts().head(10)
-            if len(agency_counts) > 0:
-                agency_fig = px.bar(
-                    x=agency_counts.index,
-                    y=agency_counts.values,
-                    title="Top 10 Agencies by Case Volume",
-                    labels={'x': 'Agency', 'y': 'Number of Cases'},
-                    color=agency_counts.values,
-                    color_continuous_scale='Viridis'
-                )
-                agency_fig.update_layout(showlegend=False, xaxis_tickangle=-45, height=350)
-            else:
-                agency_fig = px.bar(title="Agencies (No data)")
-        except:
-            agency_fig = px.bar(title="Agencies (Error)")
-    else:
-        agency_fig = px.bar(title="Agencies (No data available)")
-    
-    # Secondary Charges Table (790.07 focus)
-    secondary_data = []
-    secondary_columns = []
-    
-    if 'Is_790_07' in filtered_df.columns and len(filtered_df) > 0:
-        try:
-            df_790 = filtered_df[filtered_df['Is_790_07'] == True]
-            if len(df_790) > 0:
-                # Group by case number to see what other charges appear with 790.07
-                case_groups = df_790.groupby('CaseNumber').agg({
-                    'ChargeOffenseDescription': lambda x: ', '.join(x.unique()),
-                    'Statute_Description': lambda x: ', '.join(x.unique()),
-                    'Lead_Officer': 'first',
-                    'Age_At_Offense': 'first',
-                    'Gender': 'first',
-                    'Race_Tier_1': 'first'
-                }).reset_index()
-                
-                secondary_data = case_groups.head(50).to_dict('records')
-                secondary_columns = [
-                    {"name": "Case Number", "id": "CaseNumber"},
-                    {"name": "Officer", "id": "Lead_Officer"},
-                    {"name": "All Charges", "id": "ChargeOffenseDescription"},
-                    {"name": "All Statutes", "id": "Statute_Description"},
-                    {"name": "Age", "id": "Age_At_Offense"},
-                    {"name": "Gender", "id": "Gender"},
-                    {"name": "Race", "id": "Race_Tier_1"}
-                ]
-        except Exception as e:
-            print(f"Error creating secondary charges table: {e}")
-    
-    # Main Cases Table
-    available_columns = [col for col in ['CaseNumber', 'Lead_Officer', 'Lead_Agency', 'Statute', 'Statute_Description', 'Statute_CaseType', 
-                        'Gender', 'Race_Tier_1', 'Age_At_Offense', 'FileDate', 'City_Clean'] if col in filtered_df.columns]
-    
-    if available_columns and len(filtered_df) > 0:
-        try:
-            table_data = filtered_df[available_columns].head(100).to_dict('records')
-        except:
-            table_data = [{'Message': 'Error loading table data'}]
-    else:
-        table_data = [{'Message': 'No data available for table'}]
+    # Every output depends only on the selected rows, so any selection of all rows
+    # reuses the startup outputs, which the LRU cache may since have evicted
+    if rows_key == DEFAULT_ROWS_KEY:
+        return INITIAL_OUTPUTS + (rows_key,)
     
-    return (officer_fig, statute_fig, demographics_fig, analysis_fig, case_type_fig, 
-            timeline_fig, agency_fig, secondary_data, secondary_columns, table_data)
+    # Chart patches and table data (cached per filter combination), plus the rows key
+    return _dashboard_outputs(filters) + (rows_key,)
 
 # Run the app
 if __name__ == '__main__':